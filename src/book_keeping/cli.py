@@ -1,10 +1,14 @@
 from __future__ import annotations
 import argparse
+import os
 import re
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime, date
-from typing import List, Dict, Tuple, Optional
-from math import isclose
+from typing import List, Dict, Tuple, Optional, Iterable, Iterator, Sequence, Union
+from math import fsum, isclose
 
 from openpyxl import load_workbook
 from openpyxl.styles import numbers, Alignment
@@ -14,14 +18,50 @@ from openpyxl.utils import get_column_letter
 # ==============================
 # PDF text extraction
 # ==============================
-def read_pdf_text(pdf_path: Path) -> str:
-    """Extract text from PDF using pdfplumber if available, else PyPDF2."""
+# Words whose bottoms are within this many points are on the same visual line.
+_LINE_Y_TOLERANCE = 2.0
+# Below this many pages, process start-up costs more than it saves. Measured:
+# serial extraction runs ~2.2 ms/page, while a spawn-started worker (Windows,
+# macOS) takes ~0.38 s just to import openpyxl and PyMuPDF, so two workers
+# only break even around 340 pages.
+_PARALLEL_MIN_PAGES = 400
+
+def _pymupdf_page_text(page) -> str:
+    """
+    Rebuild visual lines from PyMuPDF words.
+    Plain get_text("text") emits each table column as its own line; the parsers
+    need date/description/amount on one line, as pdfplumber returns them.
+    """
+    lines: List[List[tuple]] = []
+    for w in sorted(page.get_text("words"), key=lambda w: (w[3], w[0])):
+        if lines and abs(w[3] - lines[-1][0][3]) <= _LINE_Y_TOLERANCE:
+            lines[-1].append(w)
+        else:
+            lines.append([w])
+    return "\n".join(" ".join(w[4] for w in sorted(ln, key=lambda w: w[0])) for ln in lines)
+
+def _pymupdf_pages_text(pdf_path: str, first: int, last: int) -> List[str]:
+    """Worker: rebuilt text of pages [first, last) of one PDF."""
+    import pymupdf
+    with pymupdf.open(pdf_path) as doc:
+        return [_pymupdf_page_text(doc[i]) for i in range(first, last)]
+
+def _pymupdf_pages_parallel(pdf_path: str, page_count: int) -> Iterator[str]:
+    """Page texts in order, extracted by contiguous page ranges in worker processes."""
+    workers = min(os.cpu_count() or 1, page_count)
+    step = -(-page_count // workers)
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        futures = [ex.submit(_pymupdf_pages_text, pdf_path, i, min(i + step, page_count))
+                   for i in range(0, page_count, step)]
+        for fut in futures:
+            yield from fut.result()
+
+def _read_pdf_text_fallback(pdf_path: Path) -> str:
+    """Whole-document text via pdfplumber if available, else PyPDF2."""
     try:
         import pdfplumber
-        text = ""
         with pdfplumber.open(str(pdf_path)) as pdf:
-            for p in pdf.pages:
-                text += (p.extract_text(x_tolerance=1, y_tolerance=1) or "") + "\n"
+            text = "".join((p.extract_text(x_tolerance=1, y_tolerance=1) or "") + "\n" for p in pdf.pages)
         if text.strip():
             return text
     except Exception:
@@ -33,15 +73,86 @@ def read_pdf_text(pdf_path: Path) -> str:
     except Exception:
         return ""
 
+def iter_pdf_lines(pdf_path: Path, parallel: bool = True) -> Iterator[str]:
+    """
+    Yield text lines page by page using PyMuPDF; with `parallel`, long documents
+    are extracted in worker processes, still yielded in page order. Falls back to
+    pdfplumber/PyPDF2 if PyMuPDF is missing, fails before producing text, or
+    finds no text at all.
+    """
+    produced = False
+    try:
+        import pymupdf
+        with pymupdf.open(str(pdf_path)) as doc:
+            if parallel and doc.page_count >= _PARALLEL_MIN_PAGES and (os.cpu_count() or 1) > 1:
+                pages = _pymupdf_pages_parallel(str(pdf_path), doc.page_count)
+            else:
+                pages = (_pymupdf_page_text(page) for page in doc)
+            for page_text in pages:
+                for ln in page_text.splitlines():
+                    produced = produced or bool(ln.strip())
+                    yield ln
+    except Exception:
+        if produced:
+            raise
+    if not produced:
+        yield from _read_pdf_text_fallback(pdf_path).splitlines()
+
+# Extracted lines are cached next to the statements, keyed by name, mtime and
+# size. Bump the version whenever extraction output changes.
+_PDF_CACHE_DIR = ".pdfcache"
+_PDF_CACHE_VERSION = 1
+# what follows "<pdf name>." in an entry, or in a write cut short by a kill
+_PDF_CACHE_ENTRY = re.compile(r"\d+\.\d+\.v\d+\.txt(?:\.tmp)?")
+
+def _pdf_cache_path(pdf_path: Path, st: os.stat_result) -> Path:
+    """Cache entry for pdf_path in its current state (st: its stat())."""
+    return (pdf_path.parent / _PDF_CACHE_DIR /
+            f"{pdf_path.name}.{st.st_mtime_ns}.{st.st_size}.v{_PDF_CACHE_VERSION}.txt")
+
+def read_pdf_lines_cached(pdf_path: Path, parallel: bool = True, write_cache: bool = True) -> List[str]:
+    """
+    iter_pdf_lines() output, reused from <folder>/.pdfcache when the PDF is
+    unchanged. With `write_cache`, a fresh extraction is stored there and older
+    entries for the same PDF (and leftover partial writes) are removed; an
+    unwritable folder just skips caching.
+    """
+    prefix = f"{pdf_path.name}."
+    cache = _pdf_cache_path(pdf_path, pdf_path.stat())
+    try:
+        with open(cache, encoding="utf-8", errors="surrogatepass", newline="") as fh:
+            return fh.read().split("\n")[:-1]
+    except OSError:
+        pass
+
+    lines = list(iter_pdf_lines(pdf_path, parallel=parallel))
+    if write_cache:
+        tmp = cache.with_name(cache.name + ".tmp")
+        try:
+            cache.parent.mkdir(exist_ok=True)
+            for old in cache.parent.iterdir():
+                if old.name.startswith(prefix) and _PDF_CACHE_ENTRY.fullmatch(old.name, len(prefix)):
+                    old.unlink()
+            with open(tmp, "w", encoding="utf-8", errors="surrogatepass", newline="") as fh:
+                fh.write("".join(ln + "\n" for ln in lines))
+            os.replace(tmp, cache)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+    return lines
+
 
 # ==============================
 # Helpers / cleaners
 # ==============================
 # Allow amounts like ".21", "0.21", "47.15", "(1,204.21)", "-.59"
 _AMOUNT_RE = r"[\(\-]?\$?(?:\d{1,3}(?:,\d{3})*|\d)?(?:\.\d{2})[\)]?"
+_AMOUNT_PAT = re.compile(_AMOUNT_RE)
+_AMOUNT_TRAILING_JUNK = re.compile(r"[^\d\.]+$")
+_AMOUNT_DROP_CHARS = str.maketrans("", "", "$,")
+_PAGE_FOOTER = re.compile(r"\bPage\s+\d+\s+of\s+\d+\b", re.I)
 
 def _norm_amount(s: str) -> Optional[float]:
-    s1 = s.replace("$", "").replace(",", "").strip()
+    s1 = s.translate(_AMOUNT_DROP_CHARS).strip()
     neg = False
     if s1.startswith("(") and s1.endswith(")"):
         neg = True
@@ -49,53 +160,82 @@ def _norm_amount(s: str) -> Optional[float]:
     if s1.startswith("-"):
         neg = True
         s1 = s1[1:]
-    # strip any trailing non-numeric ornament (e.g., diamond glyphs)
-    s1 = re.sub(r"[^\d\.]+$", "", s1)
+    # strip any trailing non-numeric ornament (e.g., diamond glyphs); rare,
+    # so only run the regex when the last character isn't part of a number
+    if s1 and s1[-1] not in "0123456789.":
+        s1 = _AMOUNT_TRAILING_JUNK.sub("", s1)
     try:
         v = float(s1)
     except ValueError:
         return None
     return -v if neg else v
 
+def _clip_at_first_amount(line: str) -> Tuple[str, Optional[re.Match]]:
+    """strip_after_first_amount() plus the amount match, so callers needn't search again."""
+    # every amount has ".dd" cents, so most wrapped description lines skip the regex
+    if "." not in line:
+        return line, None
+    m = _AMOUNT_PAT.search(line)
+    if not m:
+        return line, None
+    return line[: m.end()].rstrip(), m
+
 def strip_after_first_amount(line: str) -> str:
     """Keep text only up to (and including) the FIRST amount on the line."""
-    m = re.search(_AMOUNT_RE, line)
-    if not m:
-        return line
-    return line[: m.end()].rstrip()
+    return _clip_at_first_amount(line)[0]
 
 def clean_text(s: str) -> str:
-    s = re.sub(r"\bPage\s+\d+\s+of\s+\d+\b", "", s, flags=re.I)
-    s = re.sub(r"\s+", " ", s)
-    return s.strip()
+    # page footers are rare; only run the regex when one could be present
+    if "page" in s.lower():
+        s = _PAGE_FOOTER.sub("", s)
+    return " ".join(s.split())
 
 
 # ==============================
 # Checking parser (robust)
 # ==============================
+# One scan per line for section headers / TOTAL rows; dispatch on m.lastgroup.
+# "daily" comes first: DAILY ENDING BALANCE anywhere on a line closes the section.
+_LINE_DISPATCH = re.compile(
+    r"^(?:(?P<daily>(?=.*?DAILY\s+ENDING\s+BALANCE))"
+    r"|\s*(?:(?P<deposit>DEPOSITS\s+AND\s+ADDITIONS)"
+    r"|(?P<withdrawal>ELECTRONIC\s+WITHDRAWALS)"
+    r"|(?P<fee>FEES)"
+    r"|(?P<total>TOTAL))\b)",
+    re.I,
+)
+# First words of the anchored branches above; lines without them (or "DAILY")
+# cannot match, so they skip the regex entirely.
+_DISPATCH_PREFIXES = ("DEPOSITS", "ELECTRONIC", "FEES", "TOTAL")
+
+_DATE_RE = r"(0[1-9]|1[0-2])/(0[1-9]|[12]\d|3[01])(?:/(20\d{2}))?"
+_DATE_PAT = re.compile(_DATE_RE)
+
+_TX_STRICT = re.compile(
+    rf"^\s*{_DATE_RE}(?:\s+{_DATE_RE})?\s+(.*?)\s+({_AMOUNT_RE})\s*$"
+)
+_TX_NO_AMT = re.compile(
+    rf"^\s*{_DATE_RE}(?:\s+{_DATE_RE})?\s+(?!.*{_AMOUNT_RE}\s*$)(.+)$"
+)
+_TRAILING_AMT = re.compile(rf"({_AMOUNT_RE})\s*$")
+
+def _is_loose_tx_header(ln: str) -> bool:
+    """
+    True when a date is followed somewhere by an amount that ends the line.
+    Accepts the same lines as the old `.*?DATE.*?AMOUNT$` header pattern, but as
+    two linear scans: that pattern backtracks quadratically on lines that miss.
+    """
+    d = _DATE_PAT.search(ln)
+    # the leftmost date admits the most amounts; "mm/dd" is always 5 chars
+    return d is not None and _TRAILING_AMT.search(ln, d.start() + 5) is not None
+
 def parse_chase_transactions_full(
-    text: str,
+    text: Union[str, Iterable[str]],
     default_year: int,
     verbose: bool = False,
 ) -> Tuple[List[Dict], Dict[str, float], Dict[str, List[str]]]:
-    sect_deposits     = re.compile(r"^\s*DEPOSITS\s+AND\s+ADDITIONS\b", re.I)
-    sect_withdrawals  = re.compile(r"^\s*ELECTRONIC\s+WITHDRAWALS\b", re.I)
-    sect_fees         = re.compile(r"^\s*FEES\b", re.I)
-    sect_daily_bal    = re.compile(r"DAILY\s+ENDING\s+BALANCE", re.I)
-    line_total        = re.compile(r"^\s*TOTAL\b", re.I)
-
-    date_re    = r"(0[1-9]|1[0-2])/(0[1-9]|[12]\d|3[01])(?:/(20\d{2}))?"
-    amount_re  = _AMOUNT_RE
-
-    tx_header_strict = re.compile(
-        rf"^\s*{date_re}(?:\s+{date_re})?\s+(.*?)\s+({amount_re})\s*$"
-    )
-    tx_header_no_amt = re.compile(
-        rf"^\s*{date_re}(?:\s+{date_re})?\s+(?!.*{amount_re}\s*$)(.+)$"
-    )
-    tx_header_loose  = re.compile(rf".*?{date_re}.*?({amount_re})\s*$")
-    trailing_amt     = re.compile(rf"({amount_re})\s*$")
-
+    """Parse a Chase checking statement given as one string or an iterable of lines."""
+    lines = text.splitlines() if isinstance(text, str) else text
     transactions: List[Dict] = []
     pdf_totals = {"deposit": 0.0, "withdrawal": 0.0, "fee": 0.0}
     unparsed: Dict[str, List[str]] = {"deposit": [], "withdrawal": [], "fee": []}
@@ -107,26 +247,28 @@ def parse_chase_transactions_full(
     def finalize_current():
         nonlocal current
         if current is not None:
-            current["Description"] = "\n".join(current["desc_lines"]).strip()
+            # cleaned once here; the register writer uses it as-is. The raw
+            # lines are dropped so each record is just Date/Amount/Section/Description.
+            current["Description"] = clean_text(" ".join(current.pop("desc_lines")))
             transactions.append(current)
             current = None
 
-    for raw in text.splitlines():
+    for raw in lines:
         ln = raw.strip()
-        if sect_daily_bal.search(ln):
+        up = ln.upper()
+        kind = None
+        if up.startswith(_DISPATCH_PREFIXES) or "DAILY" in up:
+            m_line = _LINE_DISPATCH.match(ln)
+            kind = m_line.lastgroup if m_line else None
+        if kind == "daily":
             finalize_current(); section = None; pending_header = None; continue
-        
-        if sect_deposits.search(ln):
-            finalize_current(); section = "deposit"; pending_header = None; continue
-        if sect_withdrawals.search(ln):
-            finalize_current(); section = "withdrawal"; pending_header = None; continue
-        if sect_fees.search(ln):
-            finalize_current(); section = "fee"; pending_header = None; continue
+        if kind in ("deposit", "withdrawal", "fee"):
+            finalize_current(); section = kind; pending_header = None; continue
         if not section:
             continue
 
-        if line_total.search(ln):
-            m_amt = trailing_amt.search(ln)
+        if kind == "total":
+            m_amt = _TRAILING_AMT.search(ln)
             if m_amt:
                 val = _norm_amount(m_amt.group(1))
                 if val is not None:
@@ -135,8 +277,7 @@ def parse_chase_transactions_full(
 
         # Two-line header: amount on next line
         if pending_header is not None:
-            ln_clipped = strip_after_first_amount(ln)
-            m_amt_first = re.search(_AMOUNT_RE, ln_clipped)
+            ln_clipped, m_amt_first = _clip_at_first_amount(ln)
             if m_amt_first:
                 amt = _norm_amount(m_amt_first.group(0))
                 if amt is not None:
@@ -151,7 +292,15 @@ def parse_chase_transactions_full(
             pending_header["desc"] += " " + ln_clipped
             continue
 
-        m = tx_header_strict.match(ln)
+        # every header form below starts with a date; no '/' means continuation
+        if "/" not in ln:
+            if current is not None:
+                current["desc_lines"].append(strip_after_first_amount(ln))
+            else:
+                unparsed[section].append(ln)
+            continue
+
+        m = _TX_STRICT.match(ln)
         if m:
             finalize_current()
             g = m.groups()
@@ -171,7 +320,7 @@ def parse_chase_transactions_full(
             current = {"Date": tx_date, "Amount": amt, "Section": section, "desc_lines": [desc]}
             continue
 
-        m_no = tx_header_no_amt.match(ln)
+        m_no = _TX_NO_AMT.match(ln)
         if m_no:
             d1m, d1d, d1y = m_no.group(1), m_no.group(2), m_no.group(3)
             d2m, d2d, d2y = m_no.group(4), m_no.group(5), m_no.group(6)
@@ -186,11 +335,9 @@ def parse_chase_transactions_full(
             pending_header = {"date": tx_date, "desc": desc_only, "section": section}
             continue
 
-        m2 = tx_header_loose.match(ln)
-        if m2:
-            ln_clipped = strip_after_first_amount(ln)
-            m_amt_first = re.search(_AMOUNT_RE, ln_clipped)
-            dmatch = re.search(r"(0[1-9]|1[0-2])/(0[1-9]|[12]\d|3[01])(?:/(20\d{2}))?", ln_clipped)
+        if _is_loose_tx_header(ln):
+            ln_clipped, m_amt_first = _clip_at_first_amount(ln)
+            dmatch = _DATE_PAT.search(ln_clipped)
             if not (m_amt_first and dmatch):
                 unparsed[section].append(ln); continue
             amt = _norm_amount(m_amt_first.group(0))
@@ -221,36 +368,36 @@ def parse_chase_transactions_full(
 # ==============================
 # Credit card parser (multi-line + balances)
 # ==============================
-_SECTION_STARTS = [
-    r"ACCOUNT\s+ACTIVITY",
-    r"TRANSACTIONS",
-    r"TRANSACTION\s+ACTIVITY",
-    r"CURRENT\s+CHARGES",
-    r"ACTIVITY\s+DETAILS",
-]
-
-_SUMMARY_WITHIN_ACTIVITY = re.compile(
-    r"^\s*(TRANSACTIONS\s+THIS\s+CYCLE|INCLUDING\s+PAYMENTS\s+RECEIVED|TOTAL|SUBTOTAL)\b",
-    re.I
+# summary/subtotal rows inside the activity list
+_CC_SUMMARY_RE = (
+    r"^\s*(?P<summary>TRANSACTIONS\s+THIS\s+CYCLE|INCLUDING\s+PAYMENTS\s+RECEIVED|TOTAL|SUBTOTAL)\b"
 )
-
-def _locate_cc_start(lines: List[str]) -> int:
-    """Find index to start parsing from. Try known headers; else fall back to first date-at-start line."""
-    for i, ln in enumerate(lines):
-        for pat in _SECTION_STARTS:
-            if re.search(rf"^\s*{pat}\b", ln, flags=re.I):
-                return i + 1
-    date_start = re.compile(r"^\s*(0[1-9]|1[0-2])/(0[1-9]|[12]\d|3[01])(?:/\d{2,4})?\b")
-    for i, ln in enumerate(lines):
-        if date_start.match(ln or ""):
-            return i
-    return 0
+_SUMMARY_WITHIN_ACTIVITY = re.compile(_CC_SUMMARY_RE, re.I)
+
+# a date anywhere on the line, optionally with a footnote mark (07/08/24*, 07/08/2024†)
+_CC_DATE_TOKEN_RE = (
+    r"(?:^|\s)(?P<mm>0[1-9]|1[0-2])/"
+    r"(?P<dd>0[1-9]|[12]\d|3[01])"
+    r"(?:/(?P<yy>\d{2,4}))?"
+    r"(?:[*•†‡])?(?=\D|$)"
+)
+_CC_DATE_TOKEN = re.compile(_CC_DATE_TOKEN_RE, re.I)
+
+# Both in one scan for the transaction loop. The summary branch is anchored and
+# listed first, so it wins exactly when _SUMMARY_WITHIN_ACTIVITY would.
+_CC_LINE = re.compile(rf"{_CC_SUMMARY_RE}|{_CC_DATE_TOKEN_RE}", re.I)
+_CC_NEW_BALANCE = re.compile(r"\bNEW\s+BALANCE\b", re.I)
+_CC_PREV_BALANCE = [
+    re.compile(r"\bPREVIOUS\s+BALANCE\b", re.I),
+    re.compile(r"\bBALANCE\s+FROM\s+LAST\s+STATEMENT\b", re.I),
+    re.compile(r"\bPRIOR\s+BALANCE\b", re.I),
+]
 
 def parse_credit_card_transactions_multiline(
-    text: str, default_year: int
+    text: Union[str, Iterable[str]], default_year: int
 ) -> Tuple[List[Dict], Optional[float], Optional[float]]:
     """
-    Header-agnostic CC parser:
+    Header-agnostic CC parser (one pass over a string or an iterable of lines):
       - Finds Previous/New balance anywhere before the first transaction line.
       - Treats ANY line containing a date token as a transaction start, even if the
         date isn't at the start of the line and even if it has a trailing footnote
@@ -258,63 +405,11 @@ def parse_credit_card_transactions_multiline(
       - Builds a block until the next date line or a summary row.
       - Extracts the amount from the block (last line first, then others).
     """
-    lines = text.splitlines()
-
-    # ---- balances (scan from the top until we see the first transaction line) ----
-    date_token = re.compile(
-        r"(?:^|\s)(?P<mm>0[1-9]|1[0-2])/"
-        r"(?P<dd>0[1-9]|[12]\d|3[01])"
-        r"(?:/(?P<yy>\d{2,4}))?"
-        r"(?:[*•†‡])?(?=\D|$)",
-        re.I,
-    )
-    amt_re = re.compile(_AMOUNT_RE)
-    nb_re  = re.compile(r"\bNEW\s+BALANCE\b", re.I)
-    pb_res = [
-        re.compile(r"\bPREVIOUS\s+BALANCE\b", re.I),
-        re.compile(r"\bBALANCE\s+FROM\s+LAST\s+STATEMENT\b", re.I),
-        re.compile(r"\bPRIOR\s+BALANCE\b", re.I),
-    ]
-    summary_guard = re.compile(
-        r"^\s*(TRANSACTIONS\s+THIS\s+CYCLE|INCLUDING\s+PAYMENTS\s+RECEIVED|TOTAL|SUBTOTAL)\b",
-        re.I
-    )
+    lines = text.splitlines() if isinstance(text, str) else text
 
     new_balance: float | None = None
     prev_balance: float | None = None
-
-    # find the first index that looks like a transaction line (has a date token)
-    first_tx_idx = None
-    for i, ln in enumerate(lines):
-        if date_token.search(ln or ""):
-            first_tx_idx = i
-            break
-
-    # grab balances from before that point
-    scan_upto = first_tx_idx if first_tx_idx is not None else len(lines)
-    for i in range(scan_upto):
-        ln = lines[i]
-        if new_balance is None and nb_re.search(ln):
-            m_amt = amt_re.search(ln)
-            if m_amt:
-                v = _norm_amount(m_amt.group(0))
-                if v is not None:
-                    new_balance = v
-        if prev_balance is None:
-            for rx in pb_res:
-                if rx.search(ln):
-                    m_amt = amt_re.search(ln)
-                    if m_amt:
-                        v = _norm_amount(m_amt.group(0))
-                        if v is not None:
-                            prev_balance = v
-                            break
-
-    # ---- collect transactions (anywhere after the first tx-looking line) ----
     txs: List[Dict] = []
-    if first_tx_idx is None:
-        return txs, new_balance, prev_balance
-
     current_date: Optional[date] = None
     current_lines: List[str] = []
 
@@ -324,31 +419,55 @@ def parse_credit_card_transactions_multiline(
             current_date = None
             current_lines = []
             return
-        # full description for rule-based categorization
-        desc = clean_text(" ".join(current_lines))
         # extract an amount from the block (prefer the last line, then first, then others)
         amount_val: Optional[float] = None
         for line in (current_lines[-1], current_lines[0], *reversed(current_lines)):
-            m = amt_re.search(line or "")
+            m = _AMOUNT_PAT.search(line or "")
             if m:
                 v = _norm_amount(m.group(0))
                 if v is not None:
                     amount_val = v
                     break
         if amount_val is not None:
-            txs.append({"Date": current_date, "Amount": amount_val, "Desc": desc})
+            # full description for rule-based categorization (only for kept blocks)
+            txs.append({"Date": current_date, "Amount": amount_val, "Desc": clean_text(" ".join(current_lines))})
         current_date = None
         current_lines = []
 
-    for raw in lines[first_tx_idx:]:
+    in_activity = False
+    for raw in lines:
+        if not in_activity:
+            # ---- balances: scan from the top until the first transaction line ----
+            if not (raw and "/" in raw and _CC_DATE_TOKEN.search(raw)):
+                if new_balance is None and _CC_NEW_BALANCE.search(raw):
+                    m_amt = _AMOUNT_PAT.search(raw)
+                    if m_amt:
+                        v = _norm_amount(m_amt.group(0))
+                        if v is not None:
+                            new_balance = v
+                if prev_balance is None:
+                    for rx in _CC_PREV_BALANCE:
+                        if rx.search(raw):
+                            m_amt = _AMOUNT_PAT.search(raw)
+                            if m_amt:
+                                v = _norm_amount(m_amt.group(0))
+                                if v is not None:
+                                    prev_balance = v
+                                    break
+                continue
+            # ---- collect transactions (anywhere after the first tx-looking line) ----
+            in_activity = True
+
         ln = (raw or "").rstrip()
 
+        # one scan: summary row or date line; without a '/' only a summary can hit
+        m = _CC_LINE.search(ln) if "/" in ln else _SUMMARY_WITHIN_ACTIVITY.match(ln)
+
         # summary/subtotal rows end a block but are themselves ignored
-        if summary_guard.search(ln):
+        if m and m.group("summary"):
             flush()
             continue
 
-        m = date_token.search(ln)
         if m:
             flush()
             mm = int(m.group("mm"))
@@ -373,21 +492,103 @@ def parse_credit_card_transactions_multiline(
 
 
 
+# ==============================
+# Register classification
+# ==============================
+# Plain `in` tests are the fastest multi-keyword check CPython offers at this
+# size (a combined regex alternation measured 2-3x slower), so each rule stays
+# a substring test; every keyword is tested at most once per row.
+
+# E*Trade withdrawals of exactly these amounts are the 401(k) contribution.
+_401K_AMOUNTS = frozenset({4617.50, 1250.00})
+
+def classify_deposit(dlow: str) -> str:
+    """Deposit-column label for a lowercased description."""
+    if "transfer" in dlow and "0639" in dlow:
+        return "Promissory Note to bond holder Ting Wang"
+    if "e*trade" in dlow:
+        return "Transfer money from E*Trade Brokerage Account"
+    if "gainsystems" in dlow:
+        return "Income by Consulting with GAINSystems"
+    if "allegis group" in dlow:
+        return "Income by Consulting with JP Morgan Chase"
+    if "quinnox" in dlow:
+        return "Income by Consulting with US Bank"
+    return "Income"
+
+def classify_expense(dlow: str, amt_abs: float) -> str:
+    """Expense-column label for a lowercased withdrawal/fee description."""
+    if "santander" in dlow:
+        return "Car lease payment"
+    if ("telsa finasec" in dlow) and ("ting wang" in dlow):
+        return "Car lease payment"
+    if ("chase credit crd" in dlow) and ("autopaybuss" in dlow):
+        return "Credit Card Payment"
+    if "payment to chase card" in dlow:
+        return "Credit card payment"
+    if "monthly service fee" in dlow:
+        return "Bank service fee"
+    if "e*trade" in dlow:
+        if amt_abs in _401K_AMOUNTS:
+            return "Xuefen Xie 401K contribution"
+        return "Transfer money to E*Trade Brokerage Account"
+    if "transfer" in dlow and "0639" in dlow:
+        return "Return money to bond holder Ting Wang"
+    if "gusto" in dlow:
+        return "Payroll professional service fee"
+    if (("u.s. bank" in dlow) or ("us bank" in dlow)) and (("lse pmts" in dlow) or ("lease" in dlow)):
+        return "Car lease payment"
+    if ("tesla" in dlow) or ("telsa" in dlow):
+        return "Car wireless subscription payment"
+    return "Payment"
+
+def classify_card_expense(dlow: str, amt: float, previous_balance: Optional[float] = None) -> str:
+    """Expense Category for a lowercased card description and its signed amount."""
+    # (1) Negative amounts
+    if amt < 0:
+        if ("payment" in dlow) and (previous_balance is not None) and isclose(abs(amt), abs(float(previous_balance)), abs_tol=0.01):
+            return "Automatic Payment Received From Checking Account"
+        return "Office Supplies Credit"
+    # (2) Office suppliers big-box
+    if ("amazon" in dlow or "walmart" in dlow or "lowes" in dlow or "costco" in dlow
+            or "home depot" in dlow or "menards" in dlow):
+        return "Office Suppliers"
+    # (3) Apple
+    if "apple" in dlow:
+        return "Company hardware purchase"
+    # (4) Travel (transport/parking/etc.)
+    if "united" in dlow or "iparkit" in dlow or "driven car" in dlow:
+        return "Travel and Entertainment - Travel"
+    # (5) Dues / subscriptions
+    if "chatgpt" in dlow or "github" in dlow or "yahoo" in dlow:
+        return "Dues and Subscriptions"
+    # (6) Default
+    return "Travel and Entertainment - Meals"
+
+
 # ==============================
 # Excel helpers
 # ==============================
+# Shared style values: openpyxl copies them into its style table on assignment,
+# so one instance serves every cell.
+_WRAP = Alignment(wrap_text=True)
+_FMT_USD = numbers.FORMAT_CURRENCY_USD_SIMPLE
+_FMT_DATE = "MM/dd/yyyy"
+
 def find_headers(ws):
     """Locate header row and key columns for the bank register sheet."""
-    for r in range(1, 100):
-        vals = [
-            (str(ws.cell(row=r, column=c).value).strip().lower()
-             if ws.cell(row=r, column=c).value is not None else "")
-            for c in range(1, 41)
-        ]
+    # Stay inside the populated extent: on a writable sheet, reading past it
+    # fabricates empty cells that widen the sheet for every later pass.
+    max_row = min(99, ws.max_row); max_col = min(40, ws.max_column)
+    for r, row in enumerate(ws.iter_rows(min_row=1, max_row=max_row, max_col=max_col, values_only=True), start=1):
+        vals = [("" if v is None else str(v).strip().lower()) for v in row]
+        # most rows have no date label; skip the other two lookups for them
         date_col = next((i + 1 for i, v in enumerate(vals) if v in ("date", "transaction date", "posting date")), None)
+        if not date_col:
+            continue
         check_col = next((i + 1 for i, v in enumerate(vals) if v in ("check #", "check#", "check no", "check number")), None)
         amt_col = next((i + 1 for i, v in enumerate(vals) if v in ("amount", "amt", "amount (usd)", "debit/credit")), None)
-        if date_col and check_col and amt_col:
+        if check_col and amt_col:
             return r, date_col, check_col, amt_col
     return 1, 1, 2, 4
 
@@ -395,40 +596,44 @@ def find_headers(ws):
 def compute_section_sums(transactions: List[Dict]) -> Dict[str, float]:
     sums = {"deposit": 0.0, "withdrawal": 0.0, "fee": 0.0}
     for t in transactions:
-        sec = t["Section"]; amt = abs(float(t["Amount"]))
-        sums[sec] += amt
-    for k in list(sums.keys()):
-        sums[k] = round(sums[k], 2)
-    return sums
+        sums[t["Section"]] += abs(float(t["Amount"]))
+    return {k: round(v, 2) for k, v in sums.items()}
 
 
 # ---------- Credit Card sheet helpers ----------
+_CC_LABEL = re.compile(r"type\s+of\s+cred", re.I)  # matches "Type of Credit Card", "Type of Cred", etc.
+_CC_DIGITS = re.compile(r"(\d{4,5})\b")
+
 def scan_cc_blocks(ws) -> List[Dict]:
     """
     Find card blocks on 'Credit Card Register-Corp' and return:
       [{ 'top_cell': (r,c), 'digits': '0652', 'header_row': int, 'date_col': int, 'amount_col': int, 'cat_col': int }]
     More tolerant of label text (e.g., "Type of Cred") and uses a wider header search window.
     """
-    label_ok = re.compile(r"type\s+of\s+cred", re.I)  # matches "Type of Credit Card", "Type of Cred", etc.
     blocks: List[Dict] = []
-
-    for r in range(1, ws.max_row + 1):
-        for c in range(1, ws.max_column + 1):
-            v = ws.cell(row=r, column=c).value
+    # one bulk read of the sheet's values; everything below indexes this grid
+    all_rows = list(ws.iter_rows(values_only=True))
+    n_rows = len(all_rows)
+    # stripped/lowercased header-window rows, built on first use; blocks that sit
+    # side by side search the same rows
+    lowered: Dict[int, List[str]] = {}
+
+    for r, row in enumerate(all_rows, start=1):
+        for c, v in enumerate(row, start=1):
             if not isinstance(v, str):
                 continue
-            if not label_ok.search(v.strip()):
+            if not _CC_LABEL.search(v.strip()):
                 continue
 
             # digits prefer right cell, fallback to same cell
-            right_val = ws.cell(row=r, column=c + 1).value
+            right_val = row[c] if c < len(row) else None
             digits: Optional[str] = None
             if right_val is not None:
-                m = re.search(r"(\d{4,5})\b", str(right_val))
+                m = _CC_DIGITS.search(str(right_val))
                 if m:
                     digits = m.group(1)
             if digits is None:
-                m = re.search(r"(\d{4,5})\b", v)
+                m = _CC_DIGITS.search(v)
                 if m:
                     digits = m.group(1)
             if not digits:
@@ -437,12 +642,12 @@ def scan_cc_blocks(ws) -> List[Dict]:
             # Wider window for headers to the right of the label
             header_row = None
             date_col = amount_col = cat_col = None
-            for rr in range(r + 1, min(r + 40, ws.max_row + 1)):  # was +25
-                row_vals = [
-                    (str(ws.cell(row=rr, column=cc).value).strip().lower()
-                     if ws.cell(row=rr, column=cc).value is not None else "")
-                    for cc in range(c, min(c + 40, ws.max_column + 1))  # was +16
-                ]
+            for rr in range(r + 1, min(r + 40, n_rows + 1)):  # was +25
+                low = lowered.get(rr)
+                if low is None:
+                    low = lowered[rr] = [(str(hv).strip().lower() if hv is not None else "")
+                                         for hv in all_rows[rr - 1]]
+                row_vals = low[c - 1:c + 39]  # 40 columns; was 16
                 try:
                     d_idx = row_vals.index("date")
                     a_idx = row_vals.index("amount")
@@ -479,78 +684,148 @@ def write_cc_block(ws, block: Dict, txs: List[Dict], previous_balance: Optional[
     Do NOT delete/insert rows (avoids nuking other blocks on the same rows).
     Adds Expense Category classification per user rules.
     """
-    start_row = block["header_row"] + 1
+    header_row = block["header_row"]
+    start_row = header_row + 1
     date_col, amount_col, cat_col = block["date_col"], block["amount_col"], block["cat_col"]
+    cell = ws.cell
 
-    # 1) Clear a safe range in JUST THESE COLUMNS (e.g., next 600 rows)
+    # 1) Clear a safe range in JUST THESE COLUMNS (e.g., next 600 rows);
+    #    rows past the sheet's last row hold nothing, so stop there
     clear_rows = max(600, len(txs) + 50)
-    for rr in range(start_row, start_row + clear_rows):
-        ws.cell(row=rr, column=date_col).value = None
-        ws.cell(row=rr, column=amount_col).value = None
-        ws.cell(row=rr, column=cat_col).value = None
-
-    def classify(desc: str, amt: float) -> str:
-        d = (desc or "").lower()
-        # (1) Negative amounts
-        if amt < 0:
-            if ("payment" in d) and (previous_balance is not None) and isclose(abs(amt), abs(float(previous_balance)), abs_tol=0.01):
-                return "Automatic Payment Received From Checking Account"
-            return "Office Supplies Credit"
-        # (2) Office suppliers big-box
-        if any(k in d for k in ["amazon", "walmart", "lowes", "costco", "home depot", "menards"]):
-            return "Office Suppliers"
-        # (3) Apple
-        if "apple" in d:
-            return "Company hardware purchase"
-        # (4) Travel (transport/parking/etc.)
-        if any(k in d for k in ["united", "iparkit", "driven car"]):
-            return "Travel and Entertainment - Travel"
-        # (5) Dues / subscriptions
-        if any(k in d for k in ["chatgpt", "github", "yahoo"]):
-            return "Dues and Subscriptions"
-        # (6) Default
-        return "Travel and Entertainment - Meals"
-
-    # 2) Write transactions sequentially
+    for rr in range(start_row, min(start_row + clear_rows, ws.max_row + 1)):
+        cell(row=rr, column=date_col).value = None
+        cell(row=rr, column=amount_col).value = None
+        cell(row=rr, column=cat_col).value = None
+
+    # autofit widths start from the header labels and grow as rows are written
+    col_max: Dict[int, int] = {}
+    for col in (date_col, amount_col, cat_col):
+        v = cell(row=header_row, column=col).value
+        col_max[col] = len(str(v)) if v is not None else 0
+
+    # 2) Write transactions sequentially, with their formats, in one pass
     for i, t in enumerate(txs):
         r = start_row + i
         amt = float(t["Amount"])
-        desc = t.get("Desc", "")
-        ws.cell(row=r, column=date_col).value = t["Date"]
-        ws.cell(row=r, column=amount_col).value = amt
-        ws.cell(row=r, column=cat_col).value = classify(desc, amt)
-
-    # 3) Formats for these columns only
-    for i in range(max(1, len(txs))):
-        r = start_row + i
-        dcell = ws.cell(row=r, column=date_col)
-        acell = ws.cell(row=r, column=amount_col)
-        dcell.number_format = "MM/dd/yyyy"
-        acell.number_format = numbers.FORMAT_CURRENCY_USD_SIMPLE
+        category = classify_card_expense((t.get("Desc") or "").lower(), amt, previous_balance)
+        dcell = cell(row=r, column=date_col)
+        dcell.value = t["Date"]
+        dcell.number_format = _FMT_DATE
+        acell = cell(row=r, column=amount_col)
+        acell.value = amt
+        acell.number_format = _FMT_USD
+        cell(row=r, column=cat_col).value = category
+        col_max[date_col] = max(col_max[date_col], len(str(t["Date"])))
+        col_max[amount_col] = max(col_max[amount_col], len(str(amt)))
+        col_max[cat_col] = max(col_max[cat_col], len(category))
+    if not txs:
+        # an empty block still gets the formats on its first data row
+        cell(row=start_row, column=date_col).number_format = _FMT_DATE
+        cell(row=start_row, column=amount_col).number_format = _FMT_USD
+
+    # 3) Simple autofit for these columns only
+    for col, max_len in col_max.items():
+        ws.column_dimensions[get_column_letter(col)].width = min(max_len + 2, 60)
+
+
+def _parse_statement(pdf_path: str, default_year: int, checking: bool,
+                     parallel: bool = False, cache: Optional[bool] = None):
+    """
+    Extract and parse one statement; also the worker for iter_parsed_statements().
+    `cache`: None skips the on-disk cache, False only reads it, True reads and writes.
+    """
+    if cache is None:
+        lines = iter_pdf_lines(Path(pdf_path), parallel=parallel)
+    else:
+        lines = read_pdf_lines_cached(Path(pdf_path), parallel=parallel, write_cache=cache)
+    if checking:
+        return parse_chase_transactions_full(lines, default_year=default_year)
+    return parse_credit_card_transactions_multiline(lines, default_year=default_year)
 
-    # 4) Simple autofit for these columns only
-    for col in (date_col, amount_col, cat_col):
-        max_len = 0
-        letter = get_column_letter(col)
-        for r in range(block["header_row"], start_row + max(len(txs), 1)):
-            v = ws.cell(row=r, column=col).value
-            if v is not None:
-                max_len = max(max_len, len(str(v)))
-        ws.column_dimensions[letter].width = min(max_len + 2, 60)
+def _pages_to_extract(pdf_path: Path, cache: Optional[bool]) -> int:
+    """
+    Pages _parse_statement() would have to extract: 0 when the PDF's text is
+    cached (`cache` as there), else its page count via PyMuPDF (0 if it is
+    missing or can't open the file).
+    """
+    try:
+        if cache is not None and _pdf_cache_path(pdf_path, pdf_path.stat()).is_file():
+            return 0
+        import pymupdf
+        with pymupdf.open(str(pdf_path)) as doc:
+            return doc.page_count
+    except Exception:
+        return 0
+
+def _terminate_workers(ex: ProcessPoolExecutor) -> None:
+    """Cancel ex's queued work and kill its workers, running work included."""
+    if sys.version_info >= (3, 14):
+        ex.terminate_workers()
+        return
+    # no public API before 3.14: shutdown() drops the process table, so take it first
+    procs = list((ex._processes or {}).values())
+    ex.shutdown(wait=False, cancel_futures=True)
+    for proc in procs:
+        proc.terminate()
+
+def iter_parsed_statements(
+    statements: List[Tuple[Path, bool]], default_year: int, cache: Optional[bool] = None
+) -> Iterator[tuple]:
+    """
+    Parser results for each (pdf_path, is_checking) pair, in order. Several PDFs
+    are parsed side by side in worker processes (each worker reads its pages
+    serially); results are consumed one at a time, so Excel work overlaps the
+    remaining parses. Fewer than _PARALLEL_MIN_PAGES pages left to extract in
+    all are parsed serially, as is a lone PDF (which keeps page-level
+    parallelism instead).
+    `cache` is passed through to _parse_statement().
+    """
+    workers = min(os.cpu_count() or 1, len(statements))
+    if workers < 2 or sum(_pages_to_extract(pdf, cache) for pdf, _ in statements) < _PARALLEL_MIN_PAGES:
+        for pdf, checking in statements:
+            yield _parse_statement(str(pdf), default_year, checking, parallel=True, cache=cache)
+        return
+    ex = ProcessPoolExecutor(max_workers=workers)
+    futures = [ex.submit(_parse_statement, str(pdf), default_year, checking, cache=cache)
+               for pdf, checking in statements]
+    try:
+        for fut in futures:
+            yield fut.result()
+    finally:
+        # A failed validation stops the run: stop the parses still running too,
+        # or interpreter exit waits for them to finish.
+        if all(f.done() for f in futures):
+            ex.shutdown(wait=False)
+        else:
+            _terminate_workers(ex)
 
+def _list_pdfs(folder: Path) -> List[str]:
+    """Sorted names of the PDF files in folder."""
+    with os.scandir(folder) as it:
+        return sorted(e.name for e in it if e.name.lower().endswith(".pdf") and e.is_file())
 
-def find_pdf_for_digits(folder: Path, digits: str) -> Optional[Path]:
-    """Prefer '*statements-<digits>*.pdf', else any '*<digits>*.pdf'."""
-    preferred = sorted(folder.glob(f"*statements-{digits}*.pdf"))
-    if preferred:
-        return preferred[0]
-    anymatch = sorted(folder.glob(f"*{digits}*.pdf"))
-    return anymatch[0] if anymatch else None
+def find_pdf_for_digits(folder: Path, digits: str, names: Optional[Sequence[str]] = None) -> Optional[Path]:
+    """
+    Prefer '*statements-<digits>*.pdf', else any '*<digits>*.pdf'.
+    `names`: the folder's PDF names from _list_pdfs(), when the caller already has them.
+    """
+    if names is None:
+        names = _list_pdfs(folder)
+    preferred = f"statements-{digits}"
+    for name in names:
+        if preferred in name.lower():
+            return folder / name
+    for name in names:
+        if digits in name:
+            return folder / name
+    return None
 
 
 # ==============================
 # Main
 # ==============================
+_MONTH_RE = re.compile(r"(20\d{2})-(0[1-9]|1[0-2])")  # statement folder name, YYYY-MM
+
 def main():
     parser = argparse.ArgumentParser(
         description="Book-keeping: build/update registers. Template is read from project root."
@@ -560,6 +835,8 @@ def main():
     parser.add_argument("--dry-run", action="store_true", help="Simulate; do not write Excel")
     parser.add_argument("--verbose", action="store_true", help="Print detailed steps")
     parser.add_argument("--force", action="store_true", help="Write Excel even if totals mismatch")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"Re-extract every PDF instead of reusing text cached in {_PDF_CACHE_DIR}/")
     args = parser.parse_args()
 
     target = Path(args.directory)
@@ -568,7 +845,7 @@ def main():
 
     # folder YYYY-MM → year/month
     month_tag = target.name
-    m = re.fullmatch(r"(20\d{2})-(0[1-9]|1[0-2])", month_tag)
+    m = _MONTH_RE.fullmatch(month_tag)
     if not m:
         raise ValueError(f"Folder name must be YYYY-MM (got: {month_tag})")
     year = int(m.group(1)); month = int(m.group(2))
@@ -584,11 +861,10 @@ def main():
             "Place 'Corp Registers_.xlsx' next to your pyproject.toml."
         )
 
-    # pick checking PDF (*2590*)
-    checking_pdf = None
-    for cand in sorted(target.glob("*.pdf")):
-        if "2590" in cand.name:
-            checking_pdf = cand; break
+    # pick checking PDF (*2590*), first in name order; the folder listing is
+    # shared with the card lookups, so the directory is read once per run
+    pdf_names = _list_pdfs(target)
+    checking_pdf = next((target / name for name in pdf_names if "2590" in name), None)
 
     if args.verbose:
         print(f"[INFO] Project root: {project_root}")
@@ -598,175 +874,167 @@ def main():
 
     dest_excel = target / f"Corp Registers_{yyyymm}.xlsx"
     if not args.dry_run:
-        if template.resolve() != dest_excel.resolve():
-            dest_excel.write_bytes(template.read_bytes())
+        # streamed copy (sendfile where available); a hard link is not an
+        # option because openpyxl's save truncates the file in place
+        try:
+            shutil.copyfile(template, dest_excel)
+        except shutil.SameFileError:
+            pass  # dest already is the template (same file via a link): nothing to copy
 
     wb = load_workbook(dest_excel)
 
-    # --------- Bank register population ----------
-    if checking_pdf:
-        text = read_pdf_text(checking_pdf)
-        transactions, pdf_totals, unparsed = parse_chase_transactions_full(text, default_year=year, verbose=args.verbose)
-
-        ordered_tx: List[Dict] = []
-        for sec in ("deposit", "withdrawal", "fee"):
-            ordered_tx.extend([t for t in transactions if t["Section"] == sec])
-
-        sums_from_data = compute_section_sums(ordered_tx)
-
-        print("PDF Section Totals:")
-        print(f"  Deposits   : ${pdf_totals['deposit']:.2f}")
-        print(f"  Withdrawals: ${pdf_totals['withdrawal']:.2f}")
-        print(f"  Fees       : ${pdf_totals['fee']:.2f}")
-        print("Computed Totals (from data):")
-        print(f"  Deposits   : ${sums_from_data['deposit']:.2f}")
-        print(f"  Withdrawals: ${sums_from_data['withdrawal']:.2f}")
-        print(f"  Fees       : ${sums_from_data['fee']:.2f}")
-
-        mismatches = [sec for sec in ("deposit", "withdrawal", "fee")
-                      if not isclose(pdf_totals[sec], sums_from_data[sec], abs_tol=0.01)]
-        if mismatches and not args.force:
-            raise AssertionError("Section totals mismatch between PDF and parsed data. Use --force to proceed.")
-        elif mismatches:
-            print("[WARN] Totals mismatch, but --force specified; continuing.")
-
-        ws = wb["Check Register-Corp"]
-        ws["B9"].value = first_day
-        header_row, date_col, check_col, amt_col = find_headers(ws)
-        expense_col = 4; deposit_col = 5
-
-        if header_row < ws.max_row:
-            ws.delete_rows(header_row + 1, ws.max_row - header_row)
-
-        for r_i, t in enumerate(ordered_tx, start=header_row + 1):
-            ws.cell(row=r_i, column=date_col).value = t["Date"]
-            ws.cell(row=r_i, column=amt_col).value = abs(float(t["Amount"]))
-            full_desc = clean_text((t.get("Description") or "").replace("\r", " ").replace("\n", " ").replace("\t", " "))
-            ws.cell(row=r_i, column=check_col).value = full_desc
-            ws.cell(row=r_i, column=check_col).alignment = Alignment(wrap_text=True)
-
-            dlow = full_desc.lower()
-            amt_abs = round(abs(float(t["Amount"])), 2)
-
-            if t["Section"] == "deposit":
-                if "transfer" in dlow and "0639" in dlow:
-                    ws.cell(row=r_i, column=deposit_col).value = "Promissory Note to bond holder Ting Wang"
-                elif "e*trade" in dlow:
-                    ws.cell(row=r_i, column=deposit_col).value = "Transfer money from E*Trade Brokerage Account"
-                elif "gainsystems" in dlow:
-                    ws.cell(row=r_i, column=deposit_col).value = "Income by Consulting with GAINSystems"
-                elif "allegis group" in dlow:
-                    ws.cell(row=r_i, column=deposit_col).value = "Income by Consulting with JP Morgan Chase"
-                elif "quinnox" in dlow:
-                    ws.cell(row=r_i, column=deposit_col).value = "Income by Consulting with US Bank"
-                else:
-                    ws.cell(row=r_i, column=deposit_col).value = "Income"
-            else:
-                value = None
-                if ("santander" in dlow):
-                    value = "Car lease payment"
-                elif ("telsa finasec" in dlow) and ("ting wang" in dlow):
-                    value = "Car lease payment"
-                elif ("chase credit crd" in dlow) and ("autopaybuss" in dlow):
-                    value = "Credit Card Payment"
-                elif ("payment to chase card" in dlow):
-                    value = "Credit card payment"
-                elif ("monthly service fee" in dlow):
-                    value = "Bank service fee"
-                elif ("e*trade" in dlow) and (amt_abs in (4617.50, 1250.00)):
-                    value = "Xuefen Xie 401K contribution"
-                if value is None:
-                    if "e*trade" in dlow:
-                        value = "Transfer money to E*Trade Brokerage Account"
-                    elif "transfer" in dlow and "0639" in dlow:
-                        value = "Return money to bond holder Ting Wang"
-                    elif "gusto" in dlow:
-                        value = "Payroll professional service fee"
-                    elif (("u.s. bank" in dlow) or ("us bank" in dlow)) and (("lse pmts" in dlow) or ("lease" in dlow)):
-                        value = "Car lease payment"
-                    elif ("tesla" in dlow) or ("telsa" in dlow):
-                        value = "Car wireless subscription payment"
-                    else:
-                        value = "Payment"
-                ws.cell(row=r_i, column=expense_col).value = value
-
-        # format & hide extras
-        for rr in range(header_row + 1, ws.max_row + 1):
-            dcell = ws.cell(row=rr, column=date_col)
-            if isinstance(dcell.value, (datetime, date)):
-                dcell.number_format = "MM/dd/yyyy"
-            acell = ws.cell(row=rr, column=amt_col)
-            if isinstance(acell.value, (int, float)):
-                acell.number_format = numbers.FORMAT_CURRENCY_USD_SIMPLE
-
-        for name in wb.sheetnames:
-            lname = name.strip().lower()
-            if lname in ("information to provide to ta", "typical exp in trading business"):
-                wb[name].sheet_state = "hidden"
-
-        for c in range(1, ws.max_column + 1):
-            max_len = 0
-            letter = get_column_letter(c)
-            for rr in range(1, ws.max_row + 1):
-                v = ws.cell(row=rr, column=c).value
-                if v is None: continue
-                max_len = max(max_len, len(str(v)))
-            ws.column_dimensions[letter].width = min(max_len + 2, 80)
-
-    # --------- Credit Card Register-Corp ----------
-    if "Credit Card Register-Corp" in wb.sheetnames:
-        ws_cc = wb["Credit Card Register-Corp"]
-        blocks = scan_cc_blocks(ws_cc)
-        print(f"[INFO] Credit-card blocks found: {len(blocks)}")
-        for blk in blocks:
-            digits = blk["digits"]
-            print(f"[INFO] Block digits: {digits} at header row {blk['header_row']}")
-            pdf = find_pdf_for_digits(target, digits)
-            if not pdf:
-                print(f"[WARN] No PDF found in folder for card *{digits}. Skipping.")
-                continue
-            print(f"[INFO] Card {digits}: using PDF {pdf.name}")
-
-            text = read_pdf_text(pdf)
-            cc_txs, new_balance, previous_balance = parse_credit_card_transactions_multiline(text, default_year=year)
-
-            print(f"[INFO] Card {digits}: parsed {len(cc_txs)} transactions.")
-
-            # Generic validation: Previous + Σ(all amounts) == New
-            sum_all = round(sum(float(t["Amount"]) for t in cc_txs), 2)
-
-            nb_str = f"${new_balance:.2f}" if new_balance is not None else "(not found)"
-            pb_str = f"${previous_balance:.2f}" if previous_balance is not None else "(not found)"
-            print(f"[CARD {digits}] Previous Balance (PDF): {pb_str}")
-            print(f"[CARD {digits}] New Balance (PDF)    : {nb_str}")
-            print(f"[CARD {digits}] Σ(all amounts)       : ${sum_all:.2f}")
-            print(f"[CARD {digits}] Check: Previous + Σ(amounts) == New")
-
-            if (new_balance is None) or (previous_balance is None):
-                missing = []
-                if previous_balance is None: missing.append("Previous")
-                if new_balance is None:     missing.append("New")
-                msg = f"Missing {' and '.join(missing)} balance(s) for *{digits}*; cannot validate."
-                if not args.force:
-                    raise AssertionError(msg)
+    # Resolve the card blocks' PDFs up front so every statement, checking and
+    # cards alike, can be parsed side by side while the sheets are being written.
+    ws_cc = wb["Credit Card Register-Corp"] if "Credit Card Register-Corp" in wb.sheetnames else None
+    blocks = scan_cc_blocks(ws_cc) if ws_cc is not None else []
+    block_pdfs = [find_pdf_for_digits(target, blk["digits"], pdf_names) for blk in blocks]
+    statements = [(checking_pdf, True)] if checking_pdf else []
+    statements += [(pdf, False) for pdf in block_pdfs if pdf]
+    # dry runs may reuse cached text but never write it
+    cache = None if args.no_cache else not args.dry_run
+    parsed = iter_parsed_statements(statements, default_year=year, cache=cache)
+
+    try:
+        # --------- Bank register population ----------
+        if checking_pdf:
+            transactions, pdf_totals, unparsed = next(parsed)
+
+            # one pass: bucket by section (stable), then concatenate in register order
+            by_section: Dict[str, List[Dict]] = {"deposit": [], "withdrawal": [], "fee": []}
+            for t in transactions:
+                by_section[t["Section"]].append(t)
+            ordered_tx: List[Dict] = by_section["deposit"] + by_section["withdrawal"] + by_section["fee"]
+
+            sums_from_data = compute_section_sums(ordered_tx)
+
+            print("PDF Section Totals:\n"
+                  f"  Deposits   : ${pdf_totals['deposit']:.2f}\n"
+                  f"  Withdrawals: ${pdf_totals['withdrawal']:.2f}\n"
+                  f"  Fees       : ${pdf_totals['fee']:.2f}\n"
+                  "Computed Totals (from data):\n"
+                  f"  Deposits   : ${sums_from_data['deposit']:.2f}\n"
+                  f"  Withdrawals: ${sums_from_data['withdrawal']:.2f}\n"
+                  f"  Fees       : ${sums_from_data['fee']:.2f}")
+
+            mismatches = [sec for sec in ("deposit", "withdrawal", "fee")
+                          if not isclose(pdf_totals[sec], sums_from_data[sec], abs_tol=0.01)]
+            if mismatches and not args.force:
+                raise AssertionError("Section totals mismatch between PDF and parsed data. Use --force to proceed.")
+            elif mismatches:
+                print("[WARN] Totals mismatch, but --force specified; continuing.")
+
+            ws = wb["Check Register-Corp"]
+            ws["B9"].value = first_day
+            header_row, date_col, check_col, amt_col = find_headers(ws)
+            expense_col = 4; deposit_col = 5
+
+            if header_row < ws.max_row:
+                ws.delete_rows(header_row + 1, ws.max_row - header_row)
+
+            # Build every row in plain Python first, then write them in one pass.
+            # Not a JIT candidate: the work here is substring tests on str and
+            # openpyxl cell writes, which Numba can't compile (object mode is slower
+            # than CPython), and a few hundred rows never repay compilation time.
+            rows: List[Tuple[date, str, float, int, str]] = []
+            for t in ordered_tx:
+                full_desc = t["Description"]
+                dlow = full_desc.lower()
+                amt = abs(float(t["Amount"]))
+
+                if t["Section"] == "deposit":
+                    label_col, value = deposit_col, classify_deposit(dlow)
                 else:
-                    print("[WARN]", msg, "— continuing due to --force.")
-            else:
-                lhs = round(float(previous_balance) + sum_all, 2)
-                rhs = round(float(new_balance), 2)
-                if not isclose(lhs, rhs, abs_tol=0.01):
-                    msg = (f"Validation failed for *{digits}*: "
-                           f"Previous (${previous_balance:.2f}) + Σ(${sum_all:.2f}) "
-                           f"= ${lhs:.2f} != New (${new_balance:.2f})")
+                    label_col, value = expense_col, classify_expense(dlow, round(amt, 2))
+                rows.append((t["Date"], full_desc, amt, label_col, value))
+
+            # Autofit widths: seed from the template rows above the header, then
+            # track the written values as they go out instead of rescanning the sheet.
+            # sized for the written columns too: the header row may end before them
+            col_max = [0] * (max(ws.max_column, date_col, check_col, amt_col, expense_col, deposit_col) + 1)
+            for row in ws.iter_rows(min_row=1, max_row=header_row, max_col=ws.max_column, values_only=True):
+                for c, v in enumerate(row, start=1):
+                    if v is not None:
+                        col_max[c] = max(col_max[c], len(str(v)))
+
+            # Rows below the header were deleted above, so formatting each row as it
+            # is written covers everything the old post-write pass did.
+            cell = ws.cell
+            for r_i, (tx_date, full_desc, amount, label_col, value) in enumerate(rows, start=header_row + 1):
+                dcell = cell(r_i, date_col, tx_date)
+                acell = cell(r_i, amt_col, amount)
+                cell(r_i, check_col, full_desc).alignment = _WRAP
+                cell(r_i, label_col, value)
+                # formats follow the final values: with the fallback header layout
+                # the expense label lands in the amount column
+                if isinstance(dcell.value, (datetime, date)):
+                    dcell.number_format = _FMT_DATE
+                if isinstance(acell.value, (int, float)):
+                    acell.number_format = _FMT_USD
+                for c, v in ((date_col, tx_date), (amt_col, amount), (check_col, full_desc), (label_col, value)):
+                    col_max[c] = max(col_max[c], len(str(v)))
+
+            # hide extras
+            for name in wb.sheetnames:
+                lname = name.strip().lower()
+                if lname in ("information to provide to ta", "typical exp in trading business"):
+                    wb[name].sheet_state = "hidden"
+
+            for c in range(1, len(col_max)):
+                ws.column_dimensions[get_column_letter(c)].width = min(col_max[c] + 2, 80)
+
+        # --------- Credit Card Register-Corp ----------
+        if ws_cc is not None:
+            print(f"[INFO] Credit-card blocks found: {len(blocks)}")
+            for blk, pdf in zip(blocks, block_pdfs):
+                digits = blk["digits"]
+                print(f"[INFO] Block digits: {digits} at header row {blk['header_row']}")
+                if not pdf:
+                    print(f"[WARN] No PDF found in folder for card *{digits}. Skipping.")
+                    continue
+                print(f"[INFO] Card {digits}: using PDF {pdf.name}")
+
+                cc_txs, new_balance, previous_balance = next(parsed)
+
+                print(f"[INFO] Card {digits}: parsed {len(cc_txs)} transactions.")
+
+                # Generic validation: Previous + Σ(all amounts) == New
+                # (fsum: exact sum, so float drift can't move the cent comparison)
+                sum_all = round(fsum(float(t["Amount"]) for t in cc_txs), 2)
+
+                nb_str = f"${new_balance:.2f}" if new_balance is not None else "(not found)"
+                pb_str = f"${previous_balance:.2f}" if previous_balance is not None else "(not found)"
+                print(f"[CARD {digits}] Previous Balance (PDF): {pb_str}\n"
+                      f"[CARD {digits}] New Balance (PDF)    : {nb_str}\n"
+                      f"[CARD {digits}] Σ(all amounts)       : ${sum_all:.2f}\n"
+                      f"[CARD {digits}] Check: Previous + Σ(amounts) == New")
+
+                if (new_balance is None) or (previous_balance is None):
+                    missing = []
+                    if previous_balance is None: missing.append("Previous")
+                    if new_balance is None:     missing.append("New")
+                    msg = f"Missing {' and '.join(missing)} balance(s) for *{digits}*; cannot validate."
                     if not args.force:
                         raise AssertionError(msg)
                     else:
                         print("[WARN]", msg, "— continuing due to --force.")
-
-            # Write the block (now with category rules; pass previous_balance)
-            write_cc_block(ws_cc, blk, cc_txs, previous_balance=previous_balance)
-    else:
-        print("[WARN] Sheet 'Credit Card Register-Corp' not found; skipping CC population.")
+                else:
+                    lhs = round(float(previous_balance) + sum_all, 2)
+                    rhs = round(float(new_balance), 2)
+                    if not isclose(lhs, rhs, abs_tol=0.01):
+                        msg = (f"Validation failed for *{digits}*: "
+                               f"Previous (${previous_balance:.2f}) + Σ(${sum_all:.2f}) "
+                               f"= ${lhs:.2f} != New (${new_balance:.2f})")
+                        if not args.force:
+                            raise AssertionError(msg)
+                        else:
+                            print("[WARN]", msg, "— continuing due to --force.")
+
+                # Write the block (now with category rules; pass previous_balance)
+                write_cc_block(ws_cc, blk, cc_txs, previous_balance=previous_balance)
+        else:
+            print("[WARN] Sheet 'Credit Card Register-Corp' not found; skipping CC population.")
+    finally:
+        parsed.close()
 
     if not args.dry_run:
         wb.save(dest_excel)